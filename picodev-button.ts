@@ -46,6 +46,10 @@ namespace PiicoDevInputs {
         private static readonly REG_EMA_PARAMETER = 0x22;
         private static readonly REG_EMA_PERIOD = 0x23;
 
+        // Write addresses (the firmware treats bit 7 of the register as a write flag)
+        private static readonly REG_LED_WRITE = Button.REG_LED | 0x80;
+        private static readonly REG_DOUBLE_PRESS_DURATION_WRITE = Button.REG_DOUBLE_PRESS_DURATION | 0x80;
+
         private static readonly DEVICE_ID = 0x0199;  // 409 in decimal
         private static readonly BASE_ADDRESS = 0x42;
 
@@ -198,9 +202,7 @@ namespace PiicoDevInputs {
          */
         public setLED(on: boolean): void {
             try {
-                let buf = pins.createBuffer(1);
-                buf.setNumber(NumberFormat.UInt8LE, 0, on ? 0x01 : 0x00);
-                picodevUnified.writeRegister(this.addr, Button.REG_LED | 0x80, buf);
+                picodevUnified.writeRegisterByte(this.addr, Button.REG_LED_WRITE, on ? 0x01 : 0x00);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
@@ -213,7 +215,7 @@ namespace PiicoDevInputs {
             try {
                 let buf = pins.createBuffer(2);
                 buf.setNumber(NumberFormat.UInt16BE, 0, ms);
-                picodevUnified.writeRegister(this.addr, Button.REG_DOUBLE_PRESS_DURATION | 0x80, buf);
+                picodevUnified.writeRegister(this.addr, Button.REG_DOUBLE_PRESS_DURATION_WRITE, buf);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
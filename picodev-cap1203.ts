@@ -45,8 +45,6 @@ namespace PiicoDevInputs {
         private static readonly REG_SENSITIVITY_CONTROL = 0x1F;
         private static readonly REG_MULTIPLE_TOUCH_CONFIG = 0x2A;
         private static readonly REG_DELTA_COUNT_1 = 0x10;
-        private static readonly REG_DELTA_COUNT_2 = 0x11;
-        private static readonly REG_DELTA_COUNT_3 = 0x12;
 
         constructor(mode: TouchMode = TouchMode.Multi, sensitivity: number = 3, address: number = 0x28) {
             this.addr = address;
@@ -80,26 +78,7 @@ namespace PiicoDevInputs {
          * Set or clear specific bits in a register using a mask
          */
         private setBits(register: number, byteValue: number, mask: number): void {
-            // Read current register value
-            let oldByte = picodevUnified.readRegisterByte(this.addr, register);
-
-            // Modify the bits according to mask
-            let tempByte = oldByte;
-            for (let n = 0; n < 8; n++) {
-                let bitMask = (mask >> n) & 1;
-                if (bitMask === 1) {
-                    if (((byteValue >> n) & 1) === 1) {
-                        tempByte = tempByte | (1 << n);
-                    } else {
-                        tempByte = tempByte & ~(1 << n);
-                    }
-                }
-            }
-
-            // Write modified value back
-            let buf = pins.createBuffer(1);
-            buf.setNumber(NumberFormat.UInt8LE, 0, tempByte);
-            picodevUnified.writeRegister(this.addr, register, buf);
+            picodevUnified.updateRegisterBits(this.addr, register, byteValue, mask);
         }
 
         /**
@@ -110,21 +89,23 @@ namespace PiicoDevInputs {
         //% block="CAP1203 is pad $pad pressed?"
         //% weight=100
         public isPadPressed(pad: number): boolean {
+            // Check if the specific pad is pressed (bit corresponds to pad)
+            return (this.readPads() & (1 << (pad - 1))) !== 0;
+        }
+
+        /**
+         * Read the touch state of all pads as a bitmask (bit 0 = pad 1)
+         */
+        public readPads(): number {
             try {
                 // Clear interrupt first
-                let buf = pins.createBuffer(1);
-                buf.setNumber(NumberFormat.UInt8LE, 0, 0);
-                picodevUnified.writeRegister(this.addr, CAP1203.REG_MAIN_CONTROL, buf);
+                picodevUnified.writeRegisterByte(this.addr, CAP1203.REG_MAIN_CONTROL, 0);
 
                 // Read sensor input status
-                let status = picodevUnified.readRegisterByte(this.addr, CAP1203.REG_SENSOR_INPUT_STATUS);
-
-                // Check if the specific pad is pressed (bit corresponds to pad)
-                let padBit = 1 << (pad - 1);
-                return (status & padBit) !== 0;
+                return picodevUnified.readRegisterByte(this.addr, CAP1203.REG_SENSOR_INPUT_STATUS);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
-                return false;
+                return 0;
             }
         }
 
@@ -137,18 +118,12 @@ namespace PiicoDevInputs {
         //% weight=99
         public readRawValue(pad: number): number {
             try {
-                let register = 0;
-                if (pad === 1) {
-                    register = CAP1203.REG_DELTA_COUNT_1;
-                } else if (pad === 2) {
-                    register = CAP1203.REG_DELTA_COUNT_2;
-                } else if (pad === 3) {
-                    register = CAP1203.REG_DELTA_COUNT_3;
-                } else {
+                if (pad < 1 || pad > 3) {
                     return 0;
                 }
 
-                let deltaData = picodevUnified.readRegister(this.addr, register, 1);
+                // Delta count registers for pads 1-3 are contiguous
+                let deltaData = picodevUnified.readRegister(this.addr, CAP1203.REG_DELTA_COUNT_1 + pad - 1, 1);
                 if (deltaData.length > 0) {
                     return deltaData.getNumber(NumberFormat.UInt8LE, 0);
                 }
@@ -188,12 +163,7 @@ namespace PiicoDevInputs {
         //% weight=49
         public clearInterrupt(): void {
             try {
-                let buf = pins.createBuffer(1);
-                buf.setNumber(NumberFormat.UInt8LE, 0, 0);
-                picodevUnified.writeRegister(this.addr, CAP1203.REG_MAIN_CONTROL, buf);
-
-                // Read the status to complete the interrupt clear
-                picodevUnified.readRegisterByte(this.addr, CAP1203.REG_MAIN_CONTROL);
+                picodevUnified.writeRegisterByte(this.addr, CAP1203.REG_MAIN_CONTROL, 0);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
@@ -218,8 +188,10 @@ namespace PiicoDevInputs {
         control.inBackground(() => {
             while (true) {
                 if (_cap1203) {
+                    // One status read covers all three pads
+                    let status = _cap1203.readPads();
                     for (let pad = 1; pad <= 3; pad++) {
-                        let isPressed = _cap1203.isPadPressed(pad);
+                        let isPressed = (status & (1 << (pad - 1))) !== 0;
                         if (isPressed && !_cap1203LastState[pad - 1]) {
                             // Pad just pressed
                             _cap1203LastState[pad - 1] = true;
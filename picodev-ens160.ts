@@ -33,6 +33,12 @@ namespace PiicoDevEnvironmental {
         Standard = 2
     }
 
+    // eCO2 rating bands in ppm, highest first. A reading must exceed the threshold,
+    // except the lowest ("excellent") band which includes its edge.
+    const ENS160_ECO2_THRESHOLDS = [1500, 1000, 800, 600];
+    const ENS160_ECO2_RATINGS = ["bad", "poor", "fair", "good"];
+    const ENS160_ECO2_EXCELLENT_MIN = 400;
+
     /**
      * PiicoDev ENS160 Air Quality Sensor class
      */
@@ -42,6 +48,7 @@ namespace PiicoDevEnvironmental {
         private _tvoc: number;
         private _eco2: number;
         private _status: number;
+        private lastReadMs: number;  // Time of last data burst, or -1 if never read
 
         // Register addresses
         private static readonly REG_PART_ID = 0x00;
@@ -70,12 +77,16 @@ namespace PiicoDevEnvironmental {
         private static readonly VAL_OPMODE_STANDARD = 0x02;
         private static readonly VAL_OPMODE_RESET = 0xF0;
 
+        // Back-to-back reads within this window reuse the last data burst
+        private static readonly READ_CACHE_MS = 5;
+
         constructor(address: number = 0x53) {
             this.addr = address;
             this._aqi = 0;
             this._tvoc = 0;
             this._eco2 = 0;
             this._status = 0;
+            this.lastReadMs = -1;
             this.initialize();
         }
 
@@ -98,8 +109,7 @@ namespace PiicoDevEnvironmental {
                 basic.pause(20);
 
                 // Set default temperature and humidity compensation
-                this.setTemperature(25.0);
-                this.setHumidity(50.0);
+                this.setCompensation(25.0, 50.0);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
@@ -132,23 +142,29 @@ namespace PiicoDevEnvironmental {
          * Read sensor data from registers
          */
         private readData(): void {
+            let now = control.millis();
+            if (this.lastReadMs >= 0 && now - this.lastReadMs < ENS160.READ_CACHE_MS) {
+                return;
+            }
+
             try {
-                // Read device status
-                this._status = picodevUnified.readRegisterByte(this.addr, ENS160.REG_DEVICE_STATUS);
+                // Read status and all data registers at once (6 bytes total)
+                // Byte 0: status
+                // Byte 1: AQI
+                // Bytes 2-3: TVOC (little endian)
+                // Bytes 4-5: eCO2 (little endian)
+                let data = picodevUnified.readRegister(this.addr, ENS160.REG_DEVICE_STATUS, 6);
+                if (data.length < 6) {
+                    return;
+                }
+                this._status = data[0];
+                this.lastReadMs = now;
 
-                // Check if new data is available
+                // Only update readings if new data is available
                 if (this.readBit(this._status, ENS160.BIT_DEVICE_STATUS_NEWDAT)) {
-                    // Read all data registers at once (6 bytes total)
-                    let data = picodevUnified.readRegister(this.addr, ENS160.REG_DEVICE_STATUS, 6);
-
-                    // Parse the data
-                    // Byte 0: status (already read above)
-                    // Byte 1: AQI
-                    // Bytes 2-3: TVOC (little endian)
-                    // Bytes 4-5: eCO2 (little endian)
                     this._aqi = data[1];
-                    this._tvoc = data[2] | (data[3] << 8);
-                    this._eco2 = data[4] | (data[5] << 8);
+                    this._tvoc = data.getNumber(NumberFormat.UInt16LE, 2);
+                    this._eco2 = data.getNumber(NumberFormat.UInt16LE, 4);
                 }
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
@@ -207,15 +223,41 @@ namespace PiicoDevEnvironmental {
          */
         public getECO2Rating(): string {
             let eco2 = this.getECO2();
-            let rating = "invalid";
+            for (let i = 0; i < ENS160_ECO2_THRESHOLDS.length; i++) {
+                if (eco2 > ENS160_ECO2_THRESHOLDS[i]) {
+                    return ENS160_ECO2_RATINGS[i];
+                }
+            }
+            return eco2 >= ENS160_ECO2_EXCELLENT_MIN ? "excellent" : "invalid";
+        }
 
-            if (eco2 >= 400) rating = "excellent";
-            if (eco2 > 600) rating = "good";
-            if (eco2 > 800) rating = "fair";
-            if (eco2 > 1000) rating = "poor";
-            if (eco2 > 1500) rating = "bad";
+        /**
+         * Encode temperature (°C) for TEMP_IN: Kelvin scaled by 64
+         */
+        private encodeTemperature(temperature: number): number {
+            return Math.round((temperature + 273.15) * 64);
+        }
 
-            return rating;
+        /**
+         * Encode relative humidity (%) for RH_IN: scaled by 512
+         */
+        private encodeHumidity(humidity: number): number {
+            return Math.round(humidity * 512);
+        }
+
+        /**
+         * Set temperature (°C) and relative humidity (%) compensation together.
+         * TEMP_IN and RH_IN are adjacent so both go out in a single 4-byte write.
+         */
+        private setCompensation(temperature: number, humidity: number): void {
+            try {
+                let buf = pins.createBuffer(4);
+                buf.setNumber(NumberFormat.UInt16LE, 0, this.encodeTemperature(temperature));
+                buf.setNumber(NumberFormat.UInt16LE, 2, this.encodeHumidity(humidity));
+                picodevUnified.writeRegister(this.addr, ENS160.REG_TEMP_IN, buf);
+            } catch (e) {
+                picodevUnified.logI2CError(this.addr);
+            }
         }
 
         /**
@@ -223,13 +265,9 @@ namespace PiicoDevEnvironmental {
          */
         public setTemperature(temperature: number): void {
             try {
-                // Convert Celsius to Kelvin and scale by 64
-                let kelvin = temperature + 273.15;
-                let value = Math.round(kelvin * 64);
-
                 // Write as 16-bit little endian
                 let buf = pins.createBuffer(2);
-                buf.setNumber(NumberFormat.UInt16LE, 0, value);
+                buf.setNumber(NumberFormat.UInt16LE, 0, this.encodeTemperature(temperature));
                 picodevUnified.writeRegister(this.addr, ENS160.REG_TEMP_IN, buf);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
@@ -255,12 +293,9 @@ namespace PiicoDevEnvironmental {
          */
         public setHumidity(humidity: number): void {
             try {
-                // Scale humidity by 512
-                let value = Math.round(humidity * 512);
-
                 // Write as 16-bit little endian
                 let buf = pins.createBuffer(2);
-                buf.setNumber(NumberFormat.UInt16LE, 0, value);
+                buf.setNumber(NumberFormat.UInt16LE, 0, this.encodeHumidity(humidity));
                 picodevUnified.writeRegister(this.addr, ENS160.REG_RH_IN, buf);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
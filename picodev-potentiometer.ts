@@ -16,6 +16,7 @@ namespace PiicoDevInputs {
         private addr: number;
         private minValue: number;  // Minimum scaled value
         private maxValue: number;  // Maximum scaled value
+        private scale: number;     // Scaled units per raw ADC count
 
         // Register addresses
         private static readonly REG_WHOAMI = 0x01;
@@ -26,6 +27,9 @@ namespace PiicoDevInputs {
         private static readonly REG_LED = 0x07;
         private static readonly REG_SELF_TEST = 0x09;
 
+        // Write addresses (the firmware treats bit 7 of the register as a write flag)
+        private static readonly REG_LED_WRITE = Potentiometer.REG_LED | 0x80;
+
         private static readonly DEVICE_ID_POT = 0x017B;  // 379 in decimal
         private static readonly DEVICE_ID_SLIDE = 0x019B;  // 411 in decimal
         private static readonly BASE_ADDRESS = 0x35;  // 53 in decimal
@@ -34,6 +38,7 @@ namespace PiicoDevInputs {
             this.addr = address;
             this.minValue = minimum;
             this.maxValue = maximum;
+            this.scale = (maximum - minimum) / 1023;
 
             // Initialize potentiometer
             this.initialize();
@@ -78,8 +83,7 @@ namespace PiicoDevInputs {
         getValue(): number {
             let rawValue = this.getRaw();
             // Scale from 0-1023 range to min-max range
-            let scaledValue = this.minValue + (this.maxValue - this.minValue) * rawValue / 1023;
-            return scaledValue;
+            return this.minValue + this.scale * rawValue;
         }
 
         /**
@@ -87,11 +91,7 @@ namespace PiicoDevInputs {
          */
         setLED(state: boolean): void {
             try {
-                // Write to LED register with bit 7 set (0x80 | value)
-                let value = state ? 1 : 0;
-                let buf = pins.createBuffer(1);
-                buf.setNumber(NumberFormat.UInt8LE, 0, value);
-                picodevUnified.writeRegister(this.addr, 0x80 | Potentiometer.REG_LED, buf);
+                picodevUnified.writeRegisterByte(this.addr, Potentiometer.REG_LED_WRITE, state ? 1 : 0);
             } catch (e) {
                 // Silently handle errors
             }
@@ -76,6 +76,7 @@ namespace piicodev {
         private addr: number;
         private eventId: number;
         private pollingStarted: boolean;
+        private hour12Mode: boolean;  // Cached CTRL2 12/24 hour bit, only changed by setDateTime
 
         // Current date/time
         public year: number;
@@ -123,6 +124,7 @@ namespace piicodev {
             this.addr = address;
             this.eventId = 6000 + address;
             this.pollingStarted = false;
+            this.hour12Mode = false;
 
             // Initialize date/time
             this.year = 2024;
@@ -150,13 +152,12 @@ namespace piicodev {
          */
         private initialize(): void {
             try {
-                // Read device ID to verify communication
-                let id = picodevUnified.readRegisterByte(this.addr, RV3028.REG_ID);
-
                 // Configure battery switchover and trickle charger
-                this.setBatterySwitchover(true);
-                this.configTrickleCharger();
-                this.setTrickleCharger(true);
+                this.applyBackupConfig(true, true);
+
+                // Cache the hour format so getDateTime needs a single burst read
+                let ctrl2 = picodevUnified.readRegisterByte(this.addr, RV3028.REG_CTRL2);
+                this.hour12Mode = this.readBit(ctrl2, 1);
 
                 // Read current time
                 this.getDateTime();
@@ -165,13 +166,6 @@ namespace piicodev {
             }
         }
 
-        /**
-         * BCD decode (Binary Coded Decimal)
-         */
-        private bcdDecode(val: number): number {
-            return ((val >> 4) * 10) + (val & 0x0F);
-        }
-
         /**
          * BCD encode
          */
@@ -227,15 +221,10 @@ namespace piicodev {
         }
 
         /**
-         * Read multiple bytes from a register
+         * Read multiple bytes from a register (single repeated-start transfer)
          */
-        private readBytes(reg: number, length: number): number[] {
-            let buffer = picodevUnified.readRegister(this.addr, reg, length);
-            let result: number[] = [];
-            for (let i = 0; i < buffer.length; i++) {
-                result.push(buffer[i]);
-            }
-            return result;
+        private readBytes(reg: number, length: number): Buffer {
+            return picodevUnified.readRegister(this.addr, reg, length);
         }
 
         /**
@@ -250,49 +239,41 @@ namespace piicodev {
         }
 
         /**
-         * Configure battery switchover
+         * Configure battery switchover and the trickle charger (3k resistor)
+         * with a single read-modify-write of EE_BACKUP
          */
-        private setBatterySwitchover(state: boolean): void {
+        private applyBackupConfig(switchover: boolean, trickle: boolean): void {
             try {
                 let tmp = picodevUnified.readRegisterByte(this.addr, RV3028.REG_EE_BACKUP);
-                tmp = this.writeCrumb(tmp, 2, state ? 1 : 0);
-                let buf = pins.createBuffer(1);
-                buf[0] = tmp;
-                picodevUnified.writeRegister(this.addr, RV3028.REG_EE_BACKUP, buf);
+                tmp = this.setBatterySwitchover(tmp, switchover);
+                tmp = this.configTrickleCharger(tmp);
+                tmp = this.setTrickleCharger(tmp, trickle);
+                picodevUnified.writeRegisterByte(this.addr, RV3028.REG_EE_BACKUP, tmp);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
         }
 
         /**
-         * Enable/disable trickle charger
+         * Set the battery switchover bits in an EE_BACKUP value
          */
-        private setTrickleCharger(state: boolean): void {
-            try {
-                let tmp = picodevUnified.readRegisterByte(this.addr, RV3028.REG_EE_BACKUP);
-                tmp = this.writeBit(tmp, 5, state);
-                let buf = pins.createBuffer(1);
-                buf[0] = tmp;
-                picodevUnified.writeRegister(this.addr, RV3028.REG_EE_BACKUP, buf);
-            } catch (e) {
-                picodevUnified.logI2CError(this.addr);
-            }
+        private setBatterySwitchover(tmp: number, state: boolean): number {
+            return this.writeCrumb(tmp, 2, state ? 1 : 0);
         }
 
         /**
-         * Configure trickle charger resistance
+         * Set the trickle charger enable bit in an EE_BACKUP value
          */
-        private configTrickleCharger(): void {
-            try {
-                let tmp = picodevUnified.readRegisterByte(this.addr, RV3028.REG_EE_BACKUP);
-                tmp = this.setBit(tmp, 7);
-                tmp = this.writeCrumb(tmp, 0, 0);  // 3k default
-                let buf = pins.createBuffer(1);
-                buf[0] = tmp;
-                picodevUnified.writeRegister(this.addr, RV3028.REG_EE_BACKUP, buf);
-            } catch (e) {
-                picodevUnified.logI2CError(this.addr);
-            }
+        private setTrickleCharger(tmp: number, state: boolean): number {
+            return this.writeBit(tmp, 5, state);
+        }
+
+        /**
+         * Set the trickle charger resistance bits in an EE_BACKUP value
+         */
+        private configTrickleCharger(tmp: number): number {
+            tmp = this.setBit(tmp, 7);
+            return this.writeCrumb(tmp, 0, 0);  // 3k default
         }
 
         /**
@@ -301,32 +282,32 @@ namespace piicodev {
         public getDateTime(): void {
             try {
                 let data = this.readBytes(RV3028.REG_SEC, 7);
+                if (data.length < 7) {
+                    return;
+                }
 
-                this.second = this.bcdDecode(data[0]);
-                this.minute = this.bcdDecode(data[1]);
-                this.weekday = data[3] as Weekday;
-                this.day = this.bcdDecode(data[4]);
-                this.month = this.bcdDecode(data[5]);
-                this.year = this.bcdDecode(data[6]);
-
-                // Check time format
-                let ctrl2 = picodevUnified.readRegisterByte(this.addr, RV3028.REG_CTRL2);
-                let is12Hour = this.readBit(ctrl2, 1);
-
-                if (is12Hour) {
+                // In 12 hour mode bit 5 of the hour register is the AM/PM flag
+                if (this.hour12Mode) {
                     this.timeFormat = TimeFormat.Hour12;
-                    if (this.readBit(data[2], 5)) {
-                        this.ampm = AMPM.PM;
-                        let hrByte = this.clearBit(data[2], 5);
-                        this.hour = this.bcdDecode(hrByte);
-                    } else {
-                        this.ampm = AMPM.AM;
-                        this.hour = this.bcdDecode(data[2]);
-                    }
+                    this.ampm = this.readBit(data[2], 5) ? AMPM.PM : AMPM.AM;
+                    data[2] &= 0x1F;
                 } else {
                     this.timeFormat = TimeFormat.Hour24;
-                    this.hour = this.bcdDecode(data[2]);
                 }
+
+                // Decode every field in place (weekday is binary but always < 10,
+                // so BCD decoding leaves it unchanged)
+                for (let i = 0; i < 7; i++) {
+                    data[i] = ((data[i] >> 4) * 10) + (data[i] & 0x0F);
+                }
+
+                this.second = data[0];
+                this.minute = data[1];
+                this.hour = data[2];
+                this.weekday = data[3] as Weekday;
+                this.day = data[4];
+                this.month = data[5];
+                this.year = data[6];
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
@@ -359,9 +340,8 @@ namespace piicodev {
                 }
 
                 // Write CTRL2
-                let buf = pins.createBuffer(1);
-                buf[0] = ctrl2;
-                picodevUnified.writeRegister(this.addr, RV3028.REG_CTRL2, buf);
+                picodevUnified.writeRegisterByte(this.addr, RV3028.REG_CTRL2, ctrl2);
+                this.hour12Mode = this.timeFormat === TimeFormat.Hour12;
 
                 // Write date/time registers
                 this.writeBytes(RV3028.REG_SEC, [
@@ -403,9 +383,7 @@ namespace piicodev {
                 // Set WADA bit in CTRL1
                 let ctrl1 = picodevUnified.readRegisterByte(this.addr, RV3028.REG_CTRL1);
                 ctrl1 = this.writeBit(ctrl1, 5, WADA);
-                let buf1 = pins.createBuffer(1);
-                buf1[0] = ctrl1;
-                picodevUnified.writeRegister(this.addr, RV3028.REG_CTRL1, buf1);
+                picodevUnified.writeRegisterByte(this.addr, RV3028.REG_CTRL1, ctrl1);
 
                 // Configure hours
                 if (hours !== undefined && hours !== null) {
@@ -434,9 +412,7 @@ namespace piicodev {
                 // Enable/disable alarm interrupt
                 let ctrl2 = picodevUnified.readRegisterByte(this.addr, RV3028.REG_CTRL2);
                 ctrl2 = this.writeBit(ctrl2, 3, interrupt);
-                let buf2 = pins.createBuffer(1);
-                buf2[0] = ctrl2;
-                picodevUnified.writeRegister(this.addr, RV3028.REG_CTRL2, buf2);
+                picodevUnified.writeRegisterByte(this.addr, RV3028.REG_CTRL2, ctrl2);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
@@ -459,9 +435,7 @@ namespace piicodev {
                 if (this.readBit(status, 2)) {
                     // Clear alarm flag
                     status = this.writeBit(status, 2, false);
-                    let buf = pins.createBuffer(1);
-                    buf[0] = status;
-                    picodevUnified.writeRegister(this.addr, RV3028.REG_STATUS, buf);
+                    picodevUnified.writeRegisterByte(this.addr, RV3028.REG_STATUS, status);
                     return true;
                 }
                 return false;
@@ -564,9 +538,7 @@ namespace piicodev {
          */
         public clearAllInterrupts(): void {
             try {
-                let buf = pins.createBuffer(1);
-                buf[0] = 0;
-                picodevUnified.writeRegister(this.addr, RV3028.REG_STATUS, buf);
+                picodevUnified.writeRegisterByte(this.addr, RV3028.REG_STATUS, 0);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
@@ -37,6 +37,11 @@ namespace PiicoDevMotion {
         private static readonly REG_SELF_TEST = 0x09;
         private static readonly REG_WHOAMI = 0x01;
 
+        // Write addresses (the firmware treats bit 7 of the register as a write flag)
+        private static readonly REG_I2C_ADDRESS_WRITE = Ultrasonic.REG_I2C_ADDRESS | 0x80;
+        private static readonly REG_PERIOD_WRITE = Ultrasonic.REG_PERIOD | 0x80;
+        private static readonly REG_LED_WRITE = Ultrasonic.REG_LED | 0x80;
+
         // Device constants
         private static readonly BASE_ADDRESS = 0x35;  // 53 decimal
         private static readonly DEVICE_ID = 0x0242;   // 578 decimal
@@ -130,9 +135,8 @@ namespace PiicoDevMotion {
                 if (period < 0) period = 0;
                 if (period > 65535) period = 65535;
 
-                // Write with bit 7 set as per the Python implementation
                 let buf = pins.createBuffer(3);
-                buf.setNumber(NumberFormat.UInt8LE, 0, 0x80 | Ultrasonic.REG_PERIOD);
+                buf.setNumber(NumberFormat.UInt8LE, 0, Ultrasonic.REG_PERIOD_WRITE);
                 buf.setNumber(NumberFormat.UInt8LE, 1, (period >> 8) & 0xFF);  // MSB
                 buf.setNumber(NumberFormat.UInt8LE, 2, period & 0xFF);          // LSB
                 pins.i2cWriteBuffer(this.addr, buf, false);
@@ -161,11 +165,7 @@ namespace PiicoDevMotion {
          */
         setLED(state: boolean): void {
             try {
-                // Write with bit 7 set as per the Python implementation
-                let buf = pins.createBuffer(2);
-                buf.setNumber(NumberFormat.UInt8LE, 0, 0x80 | Ultrasonic.REG_LED);
-                buf.setNumber(NumberFormat.UInt8LE, 1, state ? 1 : 0);
-                pins.i2cWriteBuffer(this.addr, buf, false);
+                picodevUnified.writeRegisterByte(this.addr, Ultrasonic.REG_LED_WRITE, state ? 1 : 0);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
             }
@@ -203,9 +203,12 @@ namespace PiicoDevMotion {
          */
         readFirmware(): string {
             try {
-                let major = picodevUnified.readRegisterByte(this.addr, Ultrasonic.REG_FIRM_MAJ);
-                let minor = picodevUnified.readRegisterByte(this.addr, Ultrasonic.REG_FIRM_MIN);
-                return "" + major + "." + minor;
+                // Major and minor version registers are adjacent, read both at once
+                let data = picodevUnified.readRegister(this.addr, Ultrasonic.REG_FIRM_MAJ, 2);
+                if (data.length < 2) {
+                    return "0.0";
+                }
+                return "" + data[0] + "." + data[1];
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
                 return "0.0";
@@ -223,10 +226,7 @@ namespace PiicoDevMotion {
                     return;
                 }
 
-                let buf = pins.createBuffer(2);
-                buf.setNumber(NumberFormat.UInt8LE, 0, Ultrasonic.REG_I2C_ADDRESS);
-                buf.setNumber(NumberFormat.UInt8LE, 1, newAddr);
-                pins.i2cWriteBuffer(this.addr, buf, false);
+                picodevUnified.writeRegisterByte(this.addr, Ultrasonic.REG_I2C_ADDRESS_WRITE, newAddr);
 
                 // Update internal address
                 this.addr = newAddr;
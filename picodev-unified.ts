@@ -74,6 +74,11 @@ namespace picodevUnified {
      */
     export const I2C_FREQUENCY = 400000;
 
+    // Scratch buffers for register addresses in reads. They are filled and
+    // consumed by pins.i2cWriteBuffer without yielding, so sharing is safe.
+    const regScratch = pins.createBuffer(1);
+    const regScratch16 = pins.createBuffer(2);
+
     /**
      * Write a single byte to an I2C device
      * @param address I2C device address (7-bit)
@@ -95,10 +100,22 @@ namespace picodevUnified {
      */
     export function writeRegister(address: number, register: number, data: Buffer): number {
         let buffer = pins.createBuffer(1 + data.length);
-        buffer.setNumber(NumberFormat.UInt8LE, 0, register);
-        for (let i = 0; i < data.length; i++) {
-            buffer.setNumber(NumberFormat.UInt8LE, 1 + i, data[i]);
-        }
+        buffer[0] = register;
+        buffer.write(1, data);
+        return pins.i2cWriteBuffer(address, buffer, false);
+    }
+
+    /**
+     * Write a single byte to a specific register (8-bit address)
+     * @param address I2C device address (7-bit)
+     * @param register Register address (8-bit)
+     * @param value Byte to write
+     * @returns 0 on success, non-zero on error
+     */
+    export function writeRegisterByte(address: number, register: number, value: number): number {
+        let buffer = pins.createBuffer(2);
+        buffer[0] = register;
+        buffer[1] = value;
         return pins.i2cWriteBuffer(address, buffer, false);
     }
 
@@ -113,11 +130,9 @@ namespace picodevUnified {
     export function writeRegister16(address: number, register: number, data: Buffer): number {
         let buffer = pins.createBuffer(2 + data.length);
         // Write register address as big-endian 16-bit value
-        buffer.setNumber(NumberFormat.UInt8LE, 0, (register >> 8) & 0xFF);
-        buffer.setNumber(NumberFormat.UInt8LE, 1, register & 0xFF);
-        for (let i = 0; i < data.length; i++) {
-            buffer.setNumber(NumberFormat.UInt8LE, 2 + i, data[i]);
-        }
+        buffer[0] = (register >> 8) & 0xFF;
+        buffer[1] = register & 0xFF;
+        buffer.write(2, data);
         return pins.i2cWriteBuffer(address, buffer, false);
     }
 
@@ -139,9 +154,8 @@ namespace picodevUnified {
      * @returns Buffer containing read data, or empty buffer on error
      */
     export function readRegister(address: number, register: number, length: number): Buffer {
-        let regBuffer = pins.createBuffer(1);
-        regBuffer.setNumber(NumberFormat.UInt8LE, 0, register);
-        pins.i2cWriteBuffer(address, regBuffer, true); // repeated start
+        regScratch[0] = register;
+        pins.i2cWriteBuffer(address, regScratch, true); // repeated start
         return pins.i2cReadBuffer(address, length, false);
     }
 
@@ -154,11 +168,10 @@ namespace picodevUnified {
      * @returns Buffer containing read data, or empty buffer on error
      */
     export function readRegister16(address: number, register: number, length: number): Buffer {
-        let regBuffer = pins.createBuffer(2);
         // Write register address as big-endian 16-bit value
-        regBuffer.setNumber(NumberFormat.UInt8LE, 0, (register >> 8) & 0xFF);
-        regBuffer.setNumber(NumberFormat.UInt8LE, 1, register & 0xFF);
-        pins.i2cWriteBuffer(address, regBuffer, true); // repeated start
+        regScratch16[0] = (register >> 8) & 0xFF;
+        regScratch16[1] = register & 0xFF;
+        pins.i2cWriteBuffer(address, regScratch16, true); // repeated start
         return pins.i2cReadBuffer(address, length, false);
     }
 
@@ -171,7 +184,7 @@ namespace picodevUnified {
     export function readRegisterByte(address: number, register: number): number {
         let buffer = readRegister(address, register, 1);
         if (buffer.length > 0) {
-            return buffer.getNumber(NumberFormat.UInt8LE, 0);
+            return buffer[0];
         }
         return 0;
     }
@@ -255,10 +268,7 @@ namespace picodevUnified {
      */
     export function updateRegisterBits(address: number, register: number, value: number, mask: number): number {
         let oldValue = readRegisterByte(address, register);
-        let newValue = (oldValue & ~mask) | (value & mask);
-        let buffer = pins.createBuffer(1);
-        buffer.setNumber(NumberFormat.UInt8LE, 0, newValue);
-        return writeRegister(address, register, buffer);
+        return writeRegisterByte(address, register, (oldValue & ~mask) | (value & mask));
     }
 
     /**
@@ -272,12 +282,20 @@ namespace picodevUnified {
         return buffer.length > 0;
     }
 
+    // Last formatted error message, reused while the same device keeps failing
+    let lastErrorAddress = -1;
+    let lastErrorMessage = "";
+
     /**
      * Log an I2C error message to serial
      * @param address I2C device address that failed
      */
     export function logI2CError(address: number): void {
-        serial.writeLine(I2C_ERROR_MESSAGE + " 0x" + toHex(address));
+        if (address !== lastErrorAddress) {
+            lastErrorAddress = address;
+            lastErrorMessage = I2C_ERROR_MESSAGE + " 0x" + toHex(address);
+        }
+        serial.writeLine(lastErrorMessage);
     }
 
     /**
@@ -102,38 +102,28 @@ namespace PiicoDevEnvironmental {
 
                 this.gain = g;
 
-                let configBytes = pins.createBuffer(2);
-                let mask = pins.createBuffer(2);
-
                 // Set gain configuration and resolution based on gain value
+                let config = 0x0000;
                 if (g === 0.125) {
                     // Gain 1/8 - bits [12:11] = 10b
-                    configBytes.setNumber(NumberFormat.UInt8LE, 0, 0x00);
-                    configBytes.setNumber(NumberFormat.UInt8LE, 1, 0x10);
+                    config = 0x1000;
                     this.resolution = 0.4608;
                 } else if (g === 0.25) {
                     // Gain 1/4 - bits [12:11] = 11b
-                    configBytes.setNumber(NumberFormat.UInt8LE, 0, 0x00);
-                    configBytes.setNumber(NumberFormat.UInt8LE, 1, 0x18);
+                    config = 0x1800;
                     this.resolution = 0.2304;
                 } else if (g === 1) {
                     // Gain 1 (default) - bits [12:11] = 00b
-                    configBytes.setNumber(NumberFormat.UInt8LE, 0, 0x00);
-                    configBytes.setNumber(NumberFormat.UInt8LE, 1, 0x00);
+                    config = 0x0000;
                     this.resolution = 0.0576;
                 } else if (g === 2) {
                     // Gain 2 - bits [12:11] = 01b
-                    configBytes.setNumber(NumberFormat.UInt8LE, 0, 0x00);
-                    configBytes.setNumber(NumberFormat.UInt8LE, 1, 0x08);
+                    config = 0x0800;
                     this.resolution = 0.0288;
                 }
 
-                // Mask for bits [12:11] = 0x1800 (big-endian: 0x00 0x18)
-                mask.setNumber(NumberFormat.UInt8LE, 0, 0x18);
-                mask.setNumber(NumberFormat.UInt8LE, 1, 0x00);
-
-                // Apply the configuration
-                this.setBits(VEML6030.REG_ALS_CONF, configBytes, mask);
+                // Apply the configuration to bits [12:11]
+                this.setBits(VEML6030.REG_ALS_CONF, config, 0x1800);
                 basic.pause(4);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
@@ -141,40 +131,19 @@ namespace PiicoDevEnvironmental {
         }
 
         /**
-         * Set specific bits in a register using a mask
-         * This implements the bit manipulation logic from the Python code
+         * Set specific bits in a 16-bit register using a mask
          * @param address Register address
-         * @param byte New byte values to set
+         * @param value New bit values to set
          * @param mask Mask indicating which bits to modify
          */
-        private setBits(address: number, byte: Buffer, mask: Buffer): void {
+        private setBits(address: number, value: number, mask: number): void {
             try {
                 // Read current register value (2 bytes, little-endian)
-                let oldBytes = picodevUnified.readRegister(this.addr, address, 2);
-                let oldValue = oldBytes.getNumber(NumberFormat.UInt16LE, 0);
-
-                // Convert buffers to 16-bit integers
-                let newBits = byte.getNumber(NumberFormat.UInt16LE, 0);
-                let maskBits = mask.getNumber(NumberFormat.UInt16BE, 0); // Note: mask is big-endian
-
-                // Apply bit mask
-                let tempValue = oldValue;
-                for (let n = 0; n < 16; n++) {
-                    let bitMask = (maskBits >> n) & 1;
-                    if (bitMask === 1) {
-                        if (((newBits >> n) & 1) === 1) {
-                            // Set bit
-                            tempValue = tempValue | (1 << n);
-                        } else {
-                            // Clear bit
-                            tempValue = tempValue & ~(1 << n);
-                        }
-                    }
-                }
+                let oldValue = picodevUnified.readRegister(this.addr, address, 2).getNumber(NumberFormat.UInt16LE, 0);
 
                 // Write back modified value (little-endian)
                 let newBytes = pins.createBuffer(2);
-                newBytes.setNumber(NumberFormat.UInt16LE, 0, tempValue);
+                newBytes.setNumber(NumberFormat.UInt16LE, 0, (oldValue & ~mask) | (value & mask));
                 picodevUnified.writeRegister(this.addr, address, newBytes);
             } catch (e) {
                 picodevUnified.logI2CError(this.addr);
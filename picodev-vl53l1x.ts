@@ -100,11 +100,7 @@ namespace PiicoDevMotion {
          * Read a byte from a 16-bit register address
          */
         private readReg(reg: number): number {
-            let regBuf = pins.createBuffer(2);
-            regBuf.setNumber(NumberFormat.UInt8LE, 0, (reg >> 8) & 0xFF);
-            regBuf.setNumber(NumberFormat.UInt8LE, 1, reg & 0xFF);
-            pins.i2cWriteBuffer(this.addr, regBuf, true); // repeated start
-            let dataBuf = pins.i2cReadBuffer(this.addr, 1, false);
+            let dataBuf = picodevUnified.readRegister16(this.addr, reg, 1);
             if (dataBuf.length > 0) {
                 return dataBuf.getNumber(NumberFormat.UInt8LE, 0);
             }
@@ -115,16 +111,7 @@ namespace PiicoDevMotion {
          * Read a 16-bit value from a 16-bit register address (big-endian)
          */
         private readReg16Bit(reg: number): number {
-            let regBuf = pins.createBuffer(2);
-            regBuf.setNumber(NumberFormat.UInt8LE, 0, (reg >> 8) & 0xFF);
-            regBuf.setNumber(NumberFormat.UInt8LE, 1, reg & 0xFF);
-            pins.i2cWriteBuffer(this.addr, regBuf, true); // repeated start
-            let dataBuf = pins.i2cReadBuffer(this.addr, 2, false);
-            if (dataBuf.length >= 2) {
-                return (dataBuf.getNumber(NumberFormat.UInt8LE, 0) << 8) |
-                    dataBuf.getNumber(NumberFormat.UInt8LE, 1);
-            }
-            return 0;
+            return picodevUnified.readRegister16UInt16BE(this.addr, reg);
         }
 
         /**
@@ -170,18 +157,8 @@ namespace PiicoDevMotion {
         /**
          * Read a block of data from a 16-bit register address
          */
-        private readRegisterRange(reg: number, length: number): number[] {
-            let regBuf = pins.createBuffer(2);
-            regBuf.setNumber(NumberFormat.UInt8LE, 0, (reg >> 8) & 0xFF);
-            regBuf.setNumber(NumberFormat.UInt8LE, 1, reg & 0xFF);
-            pins.i2cWriteBuffer(this.addr, regBuf, true); // repeated start
-            let dataBuf = pins.i2cReadBuffer(this.addr, length, false);
-
-            let result: number[] = [];
-            for (let i = 0; i < dataBuf.length; i++) {
-                result.push(dataBuf.getNumber(NumberFormat.UInt8LE, i));
-            }
-            return result;
+        private readRegisterRange(reg: number, length: number): Buffer {
+            return picodevUnified.readRegister16(this.addr, reg, length);
         }
 
         /**